@@ -5,11 +5,14 @@ This library provides efficient matrix multiplication operations including:
 - Standard matrix multiplication
 - Element-wise multiplication (Hadamard product)
 - Broadcasting for compatible dimensions
+- Randomized approximate multiplication (sampling and sketching)
+- Tracked products with incremental updates
 - Comprehensive error handling
 """
 
 from .matrix import Matrix
 from .operations import MatrixOperations
+from .tracked import TrackedProduct
 from .exceptions import DimensionError, InvalidMatrixError
 
 __version__ = "1.0.0"
@@ -19,11 +22,13 @@ __email__ = "peergroup6@example.com"
 __all__ = [
     "Matrix",
     "MatrixOperations", 
+    "TrackedProduct",
     "DimensionError",
     "InvalidMatrixError",
     "multiply",
     "hadamard_product",
-    "broadcast_multiply"
+    "broadcast_multiply",
+    "approx_multiply"
 ]
 
 # Convenience functions
@@ -62,3 +67,26 @@ def hadamard_product(matrix_a, matrix_b):
 def broadcast_multiply(matrix_a, matrix_b):
     """Multiply matrices with broadcasting support."""
     return multiply(matrix_a, matrix_b, method="broadcast")
+
+def approx_multiply(matrix_a, matrix_b, samples=None, rank=None, seed=None):
+    """
+    Approximately multiply two matrices using random sampling or sketching.
+    
+    Args:
+        matrix_a: First matrix (list of lists or Matrix object)
+        matrix_b: Second matrix (list of lists or Matrix object)
+        samples: Number of column/row pairs to sample
+        rank: Dimension of the random sign sketch
+        seed: Seed for reproducible results
+    
+    Returns:
+        Tuple[Matrix, float]: Approximate result and Frobenius error estimate
+    """
+    if not isinstance(matrix_a, Matrix):
+        matrix_a = Matrix(matrix_a)
+    if not isinstance(matrix_b, Matrix):
+        matrix_b = Matrix(matrix_b)
+    
+    return MatrixOperations().approx_multiply(
+        matrix_a, matrix_b, samples=samples, rank=rank, seed=seed
+    )
@@ -2,7 +2,9 @@
 Matrix class for representing and manipulating matrices.
 """
 
-from typing import List, Union, Tuple
+import types
+import weakref
+from typing import Callable, List, Union, Tuple
 from .exceptions import InvalidMatrixError
 
 class Matrix:
@@ -25,6 +27,7 @@ class Matrix:
         self.rows = len(data)
         self.cols = len(data[0]) if data else 0
         self.shape = (self.rows, self.cols)
+        self._listeners = []
     
     def _validate_matrix(self, data: List[List[Union[int, float]]]) -> None:
         """Validate that the input data represents a valid matrix."""
@@ -53,11 +56,46 @@ class Matrix:
         raise IndexError(f"Index ({row}, {col}) out of bounds for matrix of shape {self.shape}")
     
     def set_element(self, row: int, col: int, value: Union[int, float]) -> None:
-        """Set element at specified position."""
-        if 0 <= row < self.rows and 0 <= col < self.cols:
-            self.data[row][col] = value
-        else:
+        """Set element at specified position and notify registered listeners."""
+        if not (0 <= row < self.rows and 0 <= col < self.cols):
             raise IndexError(f"Index ({row}, {col}) out of bounds for matrix of shape {self.shape}")
+        if not isinstance(value, (int, float)):
+            raise InvalidMatrixError(f"Element at ({row}, {col}) must be a number")
+        
+        old_value = self.data[row][col]
+        self.data[row][col] = value
+        
+        # Listeners may add or remove listeners, so iterate over a copy and
+        # skip any that an earlier listener has removed
+        for listener_ref in list(self._listeners):
+            if not any(ref is listener_ref for ref in self._listeners):
+                continue
+            listener = listener_ref()
+            if listener is not None:
+                listener(row, col, old_value, value)
+        self._listeners = [ref for ref in self._listeners if ref() is not None]
+    
+    def add_listener(self, listener: Callable[[int, int, Union[int, float], Union[int, float]], None]) -> None:
+        """
+        Register a callback invoked as listener(row, col, old_value, new_value)
+        after every set_element call. Direct writes to data are not reported.
+        
+        Bound methods are held weakly, so a listener's owner can be garbage
+        collected without unregistering first. Other callables are held
+        strongly. Listeners are not carried over by copy, deepcopy or pickle.
+        """
+        if isinstance(listener, types.MethodType):
+            self._listeners.append(weakref.WeakMethod(listener))
+        else:
+            self._listeners.append(lambda: listener)
+    
+    def remove_listener(self, listener: Callable[[int, int, Union[int, float], Union[int, float]], None]) -> None:
+        """Unregister a callback previously passed to add_listener."""
+        for index, listener_ref in enumerate(self._listeners):
+            if listener_ref() == listener:
+                del self._listeners[index]
+                return
+        raise ValueError("Listener is not registered")
     
     def get_row(self, row: int) -> List[Union[int, float]]:
         """Get a specific row."""
@@ -77,6 +115,12 @@ class Matrix:
                           for col in range(self.cols)]
         return Matrix(transposed_data)
     
+    def __getstate__(self) -> dict:
+        """Return picklable state without registered listeners."""
+        state = self.__dict__.copy()
+        state["_listeners"] = []
+        return state
+    
     def copy(self) -> 'Matrix':
         """Return a deep copy of the matrix."""
         return Matrix(self.data)
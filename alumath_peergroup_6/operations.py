@@ -2,7 +2,10 @@
 Matrix operations including various multiplication methods.
 """
 
-from typing import List, Union
+import math
+import random
+from collections import Counter
+from typing import List, Optional, Tuple, Union
 from .matrix import Matrix
 from .exceptions import DimensionError
 
@@ -43,6 +46,58 @@ class MatrixOperations:
         
         return Matrix(result_data)
     
+    def approx_multiply(self, matrix_a: Matrix, matrix_b: Matrix,
+                        samples: Optional[int] = None, rank: Optional[int] = None,
+                        seed: Optional[int] = None) -> Tuple[Matrix, float]:
+        """
+        Perform randomized approximate matrix multiplication (A × B).
+        
+        Exactly one of ``samples`` or ``rank`` must be given:
+        - ``samples=k``: Monte Carlo column/row sampling. k outer products
+          A[:, i] B[i, :] are drawn with probability proportional to
+          ||A[:, i]|| · ||B[i, :]|| and rescaled to give an unbiased estimate.
+        - ``rank=r``: CountSketch. Each inner index is hashed to one of r
+          buckets with a random sign, and the result is (A S)(Sᵀ B).
+        
+        After a single pass over the operands, the cost of building the
+        product scales with k (or r) instead of the inner dimension.
+        
+        Args:
+            matrix_a: First matrix (m × n)
+            matrix_b: Second matrix (n × p)
+            samples: Number of column/row pairs to sample
+            rank: Number of CountSketch buckets
+            seed: Seed for the random generator; equal seeds give equal results
+            
+        Returns:
+            Tuple[Matrix, float]: Approximate result matrix (m × p) and an
+            upper bound on the root-mean-square Frobenius norm error
+            ||AB - C||_F over random seeds; a single run may exceed it
+            
+        Raises:
+            DimensionError: If matrices cannot be multiplied
+            ValueError: If neither or both of samples and rank are given,
+                or the given value is not a positive integer
+        """
+        if matrix_a.cols != matrix_b.rows:
+            raise DimensionError(
+                f"Cannot multiply matrices of shapes {matrix_a.shape} and {matrix_b.shape}. "
+                f"Number of columns in first matrix ({matrix_a.cols}) must equal "
+                f"number of rows in second matrix ({matrix_b.rows})."
+            )
+        
+        if (samples is None) == (rank is None):
+            raise ValueError("Exactly one of samples or rank must be given")
+        
+        count = samples if samples is not None else rank
+        if isinstance(count, bool) or not isinstance(count, int) or count < 1:
+            raise ValueError(f"samples/rank must be a positive integer, got {count}")
+        
+        rng = random.Random(seed)
+        if samples is not None:
+            return self._sampled_multiply(matrix_a, matrix_b, samples, rng)
+        return self._sketched_multiply(matrix_a, matrix_b, rank, rng)
+    
     def hadamard_product(self, matrix_a: Matrix, matrix_b: Matrix) -> Matrix:
         """
         Perform element-wise multiplication (Hadamard product).
@@ -164,3 +219,70 @@ class MatrixOperations:
             result_data.append(row)
         
         return Matrix(result_data)
+    
+    def _sampled_multiply(self, matrix_a: Matrix, matrix_b: Matrix,
+                          samples: int, rng: random.Random) -> Tuple[Matrix, float]:
+        """Approximate A × B by norm-weighted sampling of column/row pairs."""
+        weights = [
+            math.sqrt(sum(value * value for value in matrix_a.get_column(k))) *
+            math.sqrt(sum(value * value for value in matrix_b.get_row(k)))
+            for k in range(matrix_a.cols)
+        ]
+        total = sum(weights)
+        result_data = [[0.0] * matrix_b.cols for _ in range(matrix_a.rows)]
+        if total == 0:
+            return Matrix(result_data), 0.0
+        
+        chosen = Counter(rng.choices(range(matrix_a.cols), weights=weights, k=samples))
+        for k, draws in sorted(chosen.items()):
+            # Unbiased rescaling: draws / (samples * p_k) with p_k = weights[k] / total
+            scale = draws * total / (samples * weights[k])
+            column = matrix_a.get_column(k)
+            row_b = matrix_b.get_row(k)
+            for i in range(matrix_a.rows):
+                a_val = column[i] * scale
+                if a_val == 0:
+                    continue
+                result_row = result_data[i]
+                for j in range(matrix_b.cols):
+                    result_row[j] += a_val * row_b[j]
+        
+        # E||AB - C||_F² <= (Σ ||A[:, k]|| · ||B[k, :]||)² / samples
+        return Matrix(result_data), total / math.sqrt(samples)
+    
+    def _sketched_multiply(self, matrix_a: Matrix, matrix_b: Matrix,
+                           rank: int, rng: random.Random) -> Tuple[Matrix, float]:
+        """Approximate A × B as (A S)(Sᵀ B) with a CountSketch matrix S (n × rank)."""
+        inner = matrix_a.cols
+        buckets = [rng.randrange(rank) for _ in range(inner)]
+        signs = [rng.choice((-1, 1)) for _ in range(inner)]
+        
+        # A S is (m × rank): column k of A is added into its bucket
+        sketch_a = []
+        for i in range(matrix_a.rows):
+            row_a = matrix_a.get_row(i)
+            sketch_row = [0.0] * rank
+            for k in range(inner):
+                sketch_row[buckets[k]] += signs[k] * row_a[k]
+            sketch_a.append(sketch_row)
+        
+        # Sᵀ B is (rank × p): row k of B is added into its bucket
+        sketch_b = [[0.0] * matrix_b.cols for _ in range(rank)]
+        for k in range(inner):
+            row_b = matrix_b.get_row(k)
+            sign = signs[k]
+            sketch_row = sketch_b[buckets[k]]
+            for j in range(matrix_b.cols):
+                sketch_row[j] += sign * row_b[j]
+        
+        result_data = []
+        for i in range(matrix_a.rows):
+            row = []
+            for j in range(matrix_b.cols):
+                row.append(sum(sketch_a[i][t] * sketch_b[t][j] for t in range(rank)))
+            result_data.append(row)
+        
+        # E||AB - C||_F² <= 2 ||A||_F² ||B||_F² / rank
+        norm_a = math.sqrt(sum(value * value for row in matrix_a.data for value in row))
+        norm_b = math.sqrt(sum(value * value for row in matrix_b.data for value in row))
+        return Matrix(result_data), math.sqrt(2.0 / rank) * norm_a * norm_b
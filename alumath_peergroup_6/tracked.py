@@ -0,0 +1,159 @@
+"""
+Tracked matrix products that stay up to date as their operands change.
+"""
+
+from typing import Optional, Set, Tuple
+from .matrix import Matrix
+from .operations import MatrixOperations
+
+class TrackedProduct:
+    """
+    Keep the product C = A × B current while A and B change via set_element.
+    
+    C is updated in place as soon as an operand changes: a changed element
+    A[i][k] is applied as a rank-1 update of row i of C (O(p)), and a changed
+    element B[k][j] as a rank-1 update of column j of C (O(m)). Once the
+    incremental work since the last full multiplication reaches the cost of
+    one, or more than ``max_changes`` entries have changed, C is recomputed
+    from scratch, which also discards accumulated rounding error.
+    
+    Only changes made through Matrix.set_element are tracked. Call close()
+    or use the tracker as a context manager to stop tracking.
+    """
+    
+    def __init__(self, matrix_a: Matrix, matrix_b: Matrix, max_changes: Optional[int] = None):
+        """
+        Compute A × B and start tracking changes to both operands.
+        
+        Args:
+            matrix_a: First matrix (m × n)
+            matrix_b: Second matrix (n × p)
+            max_changes: Number of changed entries above which C is
+                recomputed instead of updated incrementally. Defaults to the
+                break-even point against a full multiplication.
+        
+        Raises:
+            DimensionError: If matrices cannot be multiplied
+            ValueError: If max_changes is negative
+        """
+        if max_changes is not None and max_changes < 0:
+            raise ValueError(f"max_changes must be non-negative, got {max_changes}")
+        
+        self.matrix_a = matrix_a
+        self.matrix_b = matrix_b
+        self.max_changes = max_changes
+        self._ops = MatrixOperations()
+        self._result = self._ops.standard_multiply(matrix_a, matrix_b)
+        self._changed_a: Set[Tuple[int, int]] = set()
+        self._changed_b: Set[Tuple[int, int]] = set()
+        
+        # Listener names rather than bound methods, so the tracker holds no
+        # reference to itself and is freed as soon as it is dropped.
+        # A × A changes both operands with a single set_element call.
+        if matrix_a is matrix_b:
+            self._listeners = [(matrix_a, "_on_change_both")]
+        else:
+            self._listeners = [(matrix_a, "_on_change_a"), (matrix_b, "_on_change_b")]
+        for matrix, name in self._listeners:
+            matrix.add_listener(getattr(self, name))
+    
+    @property
+    def result(self) -> Matrix:
+        """The product A × B; the same Matrix object is updated in place."""
+        return self._result
+    
+    @property
+    def changed_entries(self) -> int:
+        """Number of operand entries changed since the last full recompute."""
+        return len(self._changed_a) + len(self._changed_b)
+    
+    @property
+    def dirty_rows(self) -> Set[int]:
+        """Rows of the result updated incrementally since the last full recompute."""
+        return {i for i, _ in self._changed_a}
+    
+    @property
+    def dirty_columns(self) -> Set[int]:
+        """Columns of the result updated incrementally since the last full recompute."""
+        return {j for _, j in self._changed_b}
+    
+    def recompute(self) -> None:
+        """Recompute the full product in place and reset change tracking."""
+        fresh = self._ops.standard_multiply(self.matrix_a, self.matrix_b)
+        self._result.data[:] = fresh.data
+        self._changed_a.clear()
+        self._changed_b.clear()
+    
+    def close(self) -> None:
+        """Stop tracking changes to the operands."""
+        for matrix, name in self._listeners:
+            matrix.remove_listener(getattr(self, name))
+        self._listeners = []
+    
+    def __enter__(self) -> 'TrackedProduct':
+        """Return the tracker for use in a with statement."""
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """Stop tracking changes when leaving the with block."""
+        self.close()
+    
+    def _on_change_a(self, row: int, col: int, old_value, new_value) -> None:
+        """Apply a change to A[row][col]: row `row` of C += delta · B[col, :]."""
+        self._changed_a.add((row, col))
+        if self._should_recompute():
+            self.recompute()
+            return
+        
+        delta = new_value - old_value
+        result_row = self._result.data[row]
+        b_row = self.matrix_b.data[col]
+        for j in range(self.matrix_b.cols):
+            result_row[j] += delta * b_row[j]
+    
+    def _on_change_b(self, row: int, col: int, old_value, new_value) -> None:
+        """Apply a change to B[row][col]: column `col` of C += A[:, row] · delta."""
+        self._changed_b.add((row, col))
+        if self._should_recompute():
+            self.recompute()
+            return
+        
+        delta = new_value - old_value
+        result = self._result.data
+        a_data = self.matrix_a.data
+        for i in range(self.matrix_a.rows):
+            result[i][col] += a_data[i][row] * delta
+    
+    def _on_change_both(self, row: int, col: int, old_value, new_value) -> None:
+        """
+        Apply a change to an operand X used as both A and B.
+        
+        With X' = X + D: X' × X' = X × X + D × X + X' × D
+        """
+        self._changed_a.add((row, col))
+        self._changed_b.add((row, col))
+        if self._should_recompute():
+            self.recompute()
+            return
+        
+        delta = new_value - old_value
+        result = self._result.data
+        data = self.matrix_a.data
+        
+        # D × X uses the old value of X, which differs only at (row, col)
+        result_row = result[row]
+        for j in range(self.matrix_a.cols):
+            old_entry = data[col][j] - (delta if (col, j) == (row, col) else 0)
+            result_row[j] += delta * old_entry
+        
+        for i in range(self.matrix_a.rows):
+            result[i][col] += data[i][row] * delta
+    
+    def _should_recompute(self) -> bool:
+        """Decide whether to fall back to a full recompute."""
+        if self.max_changes is not None:
+            return self.changed_entries > self.max_changes
+        
+        rows, inner, cols = self.matrix_a.rows, self.matrix_a.cols, self.matrix_b.cols
+        incremental_cost = len(self._changed_a) * cols + len(self._changed_b) * rows
+        return incremental_cost >= rows * inner * cols
@@ -2,14 +2,17 @@
 Test script to demonstrate the alumath_peergroup_6 library functionality.
 """
 
+import copy
+import pickle
 import sys
 import os
+import weakref
 
 # Add the library to the path for testing
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
-from alumath_peergroup_6 import Matrix, multiply, hadamard_product, broadcast_multiply
-from alumath_peergroup_6 import DimensionError, InvalidMatrixError
+from alumath_peergroup_6 import Matrix, multiply, hadamard_product, broadcast_multiply, approx_multiply
+from alumath_peergroup_6 import TrackedProduct, DimensionError, InvalidMatrixError
 
 def test_basic_functionality():
     """Test basic matrix operations."""
@@ -136,6 +139,131 @@ def test_matrix_properties():
     
     print()
 
+def test_approximate_multiplication():
+    """Test randomized approximate multiplication."""
+    print("=== Testing Approximate Multiplication ===")
+    
+    matrix_a = Matrix([[i + j for j in range(20)] for i in range(6)])  # 6×20
+    matrix_b = Matrix([[i - j for j in range(5)] for i in range(20)])  # 20×5
+    exact = multiply(matrix_a, matrix_b, method="standard")
+    
+    def frobenius_error(result):
+        return sum((result[i][j] - exact[i][j]) ** 2
+                   for i in range(exact.rows) for j in range(exact.cols)) ** 0.5
+    
+    for kwargs in ({"samples": 10}, {"rank": 10}):
+        result, error_estimate = approx_multiply(matrix_a, matrix_b, seed=7, **kwargs)
+        repeat, _ = approx_multiply(matrix_a, matrix_b, seed=7, **kwargs)
+        assert result == repeat, "Same seed must give the same result"
+        assert result.shape == exact.shape
+        
+        # The estimate bounds the root-mean-square error over seeds
+        squared_errors = [frobenius_error(approx_multiply(matrix_a, matrix_b, seed=seed, **kwargs)[0]) ** 2
+                          for seed in range(50)]
+        rms_error = (sum(squared_errors) / len(squared_errors)) ** 0.5
+        print(f"{kwargs}: RMS error {rms_error:.2f}, estimate {error_estimate:.2f}")
+        assert rms_error <= error_estimate, "RMS error must be within the returned estimate"
+    
+    # Different seeds draw different samples
+    result_a, _ = approx_multiply(matrix_a, matrix_b, samples=10, seed=1)
+    result_b, _ = approx_multiply(matrix_a, matrix_b, samples=10, seed=2)
+    assert result_a != result_b, "Different seeds must give different results"
+    
+    # With an inner dimension of 1 the sampled product is exact
+    result, error_estimate = approx_multiply([[1], [2]], [[3, 4]], samples=4, seed=0)
+    assert result == Matrix([[3.0, 4.0], [6.0, 8.0]])
+    
+    for kwargs in ({"samples": 5, "rank": 5}, {}, {"samples": 0}, {"samples": True}):
+        try:
+            approx_multiply(matrix_a, matrix_b, **kwargs)
+        except ValueError as e:
+            print(f"✓ Caught ValueError for {kwargs}: {e}")
+        else:
+            raise AssertionError(f"Expected ValueError for {kwargs}")
+    
+    print()
+
+def test_tracked_product():
+    """Test incremental updates of a tracked product."""
+    print("=== Testing Tracked Product ===")
+    
+    matrix_a = Matrix([[1, 2, 3], [4, 5, 6]])  # 2×3
+    matrix_b = Matrix([[7, 8], [9, 10], [11, 12]])  # 3×2
+    with TrackedProduct(matrix_a, matrix_b) as tracked:
+        result = tracked.result
+        matrix_a.set_element(0, 1, 20)
+        matrix_b.set_element(1, 0, -3)
+        matrix_b.set_element(2, 1, 0)
+        print(f"Changed entries: {tracked.changed_entries}, dirty rows: {tracked.dirty_rows}, "
+              f"dirty columns: {tracked.dirty_columns}")
+        assert tracked.changed_entries == 3
+        # A reference taken before the changes sees them too
+        assert result == multiply(matrix_a, matrix_b, method="standard")
+        assert tracked.result is result
+        print(f"Updated product:\n{tracked.result}")
+        
+        # Invalid values are rejected before the operand or tracker changes
+        try:
+            matrix_a.set_element(0, 0, "x")
+        except InvalidMatrixError as e:
+            print(f"✓ Caught InvalidMatrixError: {e}")
+        else:
+            raise AssertionError("Expected InvalidMatrixError")
+        assert matrix_a.get_element(0, 0) == 1
+        assert tracked.changed_entries == 3
+        
+        # Tracked operands can still be copied and pickled, without listeners
+        matrix_a.add_listener(lambda row, col, old_value, new_value: None)
+        for clone in (copy.deepcopy(matrix_a), pickle.loads(pickle.dumps(matrix_a))):
+            assert clone == matrix_a
+            clone.set_element(0, 0, 50)
+        assert matrix_a.get_element(0, 0) == 1
+        assert tracked.changed_entries == 3
+    
+    # A single operand used on both sides
+    square = Matrix([[1, 2], [3, 4]])
+    with TrackedProduct(square, square) as tracked_square:
+        square.set_element(1, 0, 5)
+        square.set_element(1, 1, -2)
+        assert tracked_square.result == multiply(square, square, method="standard")
+    
+    # Too many changes fall back to a full recompute
+    with TrackedProduct(matrix_a, matrix_b, max_changes=1) as tracked:
+        matrix_a.set_element(1, 2, 1)
+        assert tracked.changed_entries == 1
+        matrix_a.set_element(1, 1, 1)
+        assert tracked.changed_entries == 0
+        assert tracked.result == multiply(matrix_a, matrix_b, method="standard")
+    
+    matrix_a.set_element(0, 0, 100)
+    assert tracked.changed_entries == 0
+    
+    # Built-in callables can be listeners and are held strongly
+    matrix_a.add_listener(print)
+    matrix_a.set_element(0, 0, 1)
+    matrix_a.remove_listener(print)
+    
+    # A listener may close a tracker while set_element is running
+    trackers = []
+    closer = lambda row, col, old_value, new_value: trackers[0].close()
+    matrix_a.add_listener(closer)
+    trackers.append(TrackedProduct(matrix_a, matrix_b))
+    matrix_a.set_element(0, 0, 3)
+    matrix_a.remove_listener(closer)
+    matrix_a.set_element(0, 1, 4)
+    matrix_b.set_element(0, 1, 4)
+    assert trackers[0].changed_entries == 0
+    
+    # A tracker dropped without close() is freed right away
+    tracked = TrackedProduct(matrix_a, matrix_b)
+    tracker_ref = weakref.ref(tracked)
+    del tracked
+    assert tracker_ref() is None
+    matrix_a.set_element(0, 0, 1)
+    matrix_b.set_element(0, 0, 1)
+    
+    print()
+
 def run_all_tests():
     """Run all test functions."""
     print("Running alumath_peergroup_6 Library Tests")
@@ -146,6 +274,8 @@ def run_all_tests():
     test_broadcasting()
     test_error_handling()
     test_matrix_properties()
+    test_approximate_multiplication()
+    test_tracked_product()
     
     print("All tests completed successfully! 🎉")
 